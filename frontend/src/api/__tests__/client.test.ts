@@ -65,7 +65,7 @@ describe('getDefaultVehicle', () => {
 });
 
 describe('viewVehicle', () => {
-  it('should return base64 PNG data', async () => {
+  it('should return a data URL for the preview image', async () => {
     const mockVehicle: VehicleType = {
       vertices: [[0, 0, 0]],
       faces: [[0, 1, 2]],
@@ -80,7 +80,7 @@ describe('viewVehicle', () => {
 
     (global.fetch as any).mockResolvedValue({
       ok: true,
-      json: async () => ({ data: mockBase64 }),
+      json: async () => ({ data: mockBase64, mime_type: 'image/webp' }),
     });
 
     const result = await viewVehicle(mockVehicle);
@@ -93,7 +93,7 @@ describe('viewVehicle', () => {
         body: JSON.stringify(mockVehicle),
       }
     );
-    expect(result).toBe(mockBase64);
+    expect(result).toBe(`data:image/webp;base64,${mockBase64}`);
   });
 
   it('should throw error on failed request', async () => {
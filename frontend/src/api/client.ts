@@ -93,10 +93,10 @@ export async function generateVehicle(
 }
 
 /**
- * Generates a base64-encoded PNG preview of a vehicle.
+ * Generates an image preview of a vehicle.
  *
  * @param vehicle - The vehicle to render
- * @returns Base64-encoded PNG image string
+ * @returns Data URL for the encoded image (WebP from current servers)
  * @throws Error if the request fails
  */
 export async function viewVehicle(vehicle: VehicleType): Promise<string> {
@@ -113,7 +113,7 @@ export async function viewVehicle(vehicle: VehicleType): Promise<string> {
   }
 
   const data = await response.json();
-  return data.data;
+  return `data:${data.mime_type ?? 'image/png'};base64,${data.data}`;
 }
 
 /**
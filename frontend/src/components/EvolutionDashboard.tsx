@@ -323,7 +323,7 @@ export function EvolutionDashboard() {
             <div className="mt-4">
               <h4 className="text-md font-semibold mb-2">Best Vehicle Preview</h4>
               <img
-                src={`data:image/png;base64,${bestVehicleImage}`}
+                src={bestVehicleImage}
                 alt="Best vehicle"
                 className="max-w-full h-auto border border-gray-300 rounded"
               />
@@ -329,7 +329,7 @@ describe('EvolutionDashboard', () => {
   describe('Best Vehicle Preview', () => {
     it('should call viewVehicle when Show Preview is clicked', async () => {
       const mockViewVehicle = vi.mocked(apiClient.viewVehicle);
-      mockViewVehicle.mockResolvedValue('base64imagedata');
+      mockViewVehicle.mockResolvedValue('data:image/webp;base64,base64imagedata');
 
       useVehicleStore.setState({ generations: [mockGenerationResult] });
 
@@ -345,7 +345,7 @@ describe('EvolutionDashboard', () => {
 
     it('should display preview image after loading', async () => {
       const mockViewVehicle = vi.mocked(apiClient.viewVehicle);
-      mockViewVehicle.mockResolvedValue('base64imagedata');
+      mockViewVehicle.mockResolvedValue('data:image/webp;base64,base64imagedata');
 
       useVehicleStore.setState({ generations: [mockGenerationResult] });
 
@@ -357,7 +357,7 @@ describe('EvolutionDashboard', () => {
       await waitFor(() => {
         const image = screen.getByAltText('Best vehicle');
         expect(image).toBeInTheDocument();
-        expect(image).toHaveAttribute('src', 'data:image/png;base64,base64imagedata');
+        expect(image).toHaveAttribute('src', 'data:image/webp;base64,base64imagedata');
       });
     });
 
@@ -365,7 +365,7 @@ describe('EvolutionDashboard', () => {
       const mockViewVehicle = vi.mocked(apiClient.viewVehicle);
       mockViewVehicle.mockImplementation(async () => {
         await new Promise((resolve) => setTimeout(resolve, 100));
-        return 'base64imagedata';
+        return 'data:image/webp;base64,base64imagedata';
       });
 
       useVehicleStore.setState({ generations: [mockGenerationResult] });
@@ -19,6 +19,13 @@ DEFAULT_MAX_WING_DIMENSION_M = 4.5
 # Simulation
 FRAMERATE = 60
 TIME_STEP = 0.02
+DROP_TEST_TIMESTEP = 0.01
+DROP_TEST_SOLVER_ITERATIONS = 20
+# The explicit Euler integrator diverges on many mesh wings at the coarser
+# timestep; implicitfast keeps them stable.
+DROP_TEST_INTEGRATOR = "implicitfast"
+# Simulated seconds after which a drop test is abandoned.
+DROP_TEST_MAX_TIME = 300.0
 
 # Reproduction constants
 MUTATION_RATIO = 0.05
@@ -1,19 +1,35 @@
+import atexit
+import threading
 from collections.abc import Generator
 from typing import Any
 
+import numpy as np
 import pymongo
+from bson.binary import USER_DEFINED_SUBTYPE, Binary
 from pymongo.database import Database
 
-current_data_version = 'v1'
+# v2: vertices are packed float32 bytes (see _encode_arrays).
+current_data_version = 'v2'
+
+
+_CLIENT: pymongo.MongoClient[Any] | None = None
+# get_db runs on the server's threadpool, so first requests can race.
+_CLIENT_LOCK = threading.Lock()
+
+
+def _get_client() -> pymongo.MongoClient[Any]:
+    # MongoClient owns a connection pool and is thread-safe, so one client is
+    # shared for the life of the process instead of being opened per request.
+    global _CLIENT
+    with _CLIENT_LOCK:
+        if _CLIENT is None:
+            _CLIENT = pymongo.MongoClient("mongodb://mongo:27017/")
+            atexit.register(_CLIENT.close)
+        return _CLIENT
 
 
 def get_db() -> Generator[Database[Any], None, None]:
-    try:
-        client: pymongo.MongoClient[Any] = pymongo.MongoClient("mongodb://mongo:27017/")
-        db = client["gliders"]
-        yield db
-    finally:
-        client.close()
+    yield _get_client()["gliders"]
 
 
 def write(
@@ -21,4 +37,32 @@ def write(
     data: dict[str, Any],
     data_version: str = current_data_version,
 ) -> None:
-    db[f"data-{data_version}"].insert_one(data)
+    db[f"data-{data_version}"].insert_one(_encode_arrays(data))
+
+
+def _encode_arrays(value: Any, key: str | None = None) -> Any:
+    # Vertex arrays are stored as packed float32 bytes rather than as nested
+    # BSON arrays of doubles. Other arrays have no agreed encoding.
+    if isinstance(value, np.ndarray):
+        is_vertices = (
+            key == "vertices"
+            and value.dtype.kind == "f"
+            and value.ndim == 2
+            and value.shape[1] == 3
+        )
+        if not is_vertices:
+            raise TypeError(
+                f"Cannot store a {value.dtype} array of shape {value.shape}"
+                f" under {key!r}; only float (N, 3) 'vertices' are packed"
+            )
+        return Binary(value.astype(np.float32).tobytes(), USER_DEFINED_SUBTYPE)
+    if isinstance(value, dict):
+        return {k: _encode_arrays(item, k) for k, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode_arrays(item) for item in value]
+    return value
+
+
+def decode_vertices(blob: bytes) -> np.ndarray:
+    """Decode vertices stored by write() back into an (N, 3) float32 array."""
+    return np.frombuffer(blob, dtype=np.float32).reshape(-1, 3)
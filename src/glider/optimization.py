@@ -1,4 +1,9 @@
+import functools
+import multiprocessing
+import os
+import threading
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from typing import TypedDict
 
 import mujoco
@@ -8,15 +13,24 @@ from .constants import (
     AIR_DENSITY,
     AIR_VISCOSITY,
     DEFAULT_MAX_WING_DIMENSION_M,
+    DROP_TEST_INTEGRATOR,
+    DROP_TEST_SOLVER_ITERATIONS,
+    DROP_TEST_TIMESTEP,
     MIN_THICKNESS_RATIO,
     THINNESS_PENALTY_WEIGHT,
 )
 from .shapes import NacaConfig, ParametricConfig, ShapeConfig
+from .simulation import landing_distance, step_to_landing
 from .vehicle import Vehicle
 
 NUM_GENES = 10
 DROP_TEST_HEIGHT = 50.0
 
+# Created on first use so importing the module doesn't spawn workers.
+_POOL: ProcessPoolExecutor | None = None
+# Server handlers call into this module from several executor threads.
+_POOL_LOCK = threading.Lock()
+
 
 class TrajectoryFrameDict(TypedDict):
     time: float
@@ -24,8 +38,9 @@ class TrajectoryFrameDict(TypedDict):
     orientation: list[float]
 
 
-def create_point(max_dim_m: float) -> list[float]:
-    return list(np.random.random() * max_dim_m for _ in range(3))
+def create_points(n: int, max_dim_m: float) -> np.ndarray:
+    """Return an (n, 3) array of random points within a max_dim_m cube."""
+    return np.random.random((n, 3)) * max_dim_m
 
 
 def drop_test_glider(
@@ -37,7 +52,10 @@ def drop_test_glider(
 
     world_xml = f"""
 <mujoco>
-    <option density="{AIR_DENSITY}" viscosity="{AIR_VISCOSITY}" wind="{wind}"/>
+    <option density="{AIR_DENSITY}" viscosity="{AIR_VISCOSITY}" wind="{wind}"
+        timestep="{DROP_TEST_TIMESTEP}"
+        integrator="{DROP_TEST_INTEGRATOR}"
+        iterations="{DROP_TEST_SOLVER_ITERATIONS}"/>
     <worldbody>
         <light name="top" pos="0 0 5"/>
         <camera name="fixed" pos="0 -100 100" euler="40 0 0"/>
@@ -45,9 +63,9 @@ def drop_test_glider(
         {glider_xml}
         <!-- Landing Platform -->
         <body name="platform" pos="0 0 0">
-            <geom name="platform-geom" type="box"
+            <geom name="platform-geom" type="plane"
                 size="1500 1500 1" rgba="1 1 1 1"
-                pos="0 0 {-height}"/>
+                pos="0 0 {1 - height}"/>
         </body>
     </worldbody>
 
@@ -58,7 +76,7 @@ def drop_test_glider(
     return world_xml
 
 
-def thinness_ratio(vertices: list[list[float]]) -> float:
+def thinness_ratio(vertices: list[list[float]] | np.ndarray) -> float:
     points = np.asarray(vertices, dtype=float)
     if points.shape[0] < 3:
         return 1.0
@@ -77,7 +95,9 @@ def thinness_ratio(vertices: list[list[float]]) -> float:
     return float(min_axis / max_axis)
 
 
-def _compute_fitness(distance: float, vertices: list[list[float]]) -> float:
+def compute_fitness(
+    distance: float, vertices: list[list[float]] | np.ndarray
+) -> float:
     """Compute fitness from glide distance and vertex geometry."""
     ratio = thinness_ratio(vertices)
     thinness_penalty = 0.0
@@ -88,18 +108,37 @@ def _compute_fitness(distance: float, vertices: list[list[float]]) -> float:
     return float(distance - thinness_penalty)
 
 
-def fitness_func(test_vehicle: Vehicle) -> float:
+@functools.lru_cache(maxsize=1024)
+def _compile(world_xml: str) -> mujoco.MjModel:
+    # Models are never mutated after compilation, so survivors re-entering
+    # the next generation can share one. Each caller allocates its own MjData.
+    return mujoco.MjModel.from_xml_string(world_xml)
+
+
+def build_model(test_vehicle: Vehicle) -> mujoco.MjModel:
+    """Compile the drop-test world for a vehicle into a MuJoCo model."""
     test_xml = drop_test_glider(test_vehicle, height=DROP_TEST_HEIGHT)
+    return _compile(test_xml)
 
-    model = mujoco.MjModel.from_xml_string(test_xml)
-    data = mujoco.MjData(model)
-    mujoco.mj_resetData(model, data)  # Reset state and time.
 
-    while len(data.contact) < 1:  # Render until landing
-        mujoco.mj_step(model, data)
+def rollout(model: mujoco.MjModel, data: mujoco.MjData) -> float:
+    """
+    Step a drop test from rest until first contact; return glide distance.
+
+    Vehicles that diverge or never land score a distance of 0.0.
+    """
+    for _ in step_to_landing(model, data):
+        pass
 
-    distance = abs(data.geom("vehicle-wing").xpos[0])
-    return _compute_fitness(distance, test_vehicle.vertices)
+    return landing_distance(data)
+
+
+def fitness_func(test_vehicle: Vehicle) -> float:
+    model = build_model(test_vehicle)
+    data = mujoco.MjData(model)
+
+    distance = rollout(model, data)
+    return compute_fitness(distance, test_vehicle.vertices)
 
 
 def simulate_trajectory(
@@ -107,16 +146,11 @@ def simulate_trajectory(
     sample_rate: int = 60,
 ) -> tuple[list[TrajectoryFrameDict], float]:
     """Run a drop test and return sampled trajectory data plus fitness."""
-    test_xml = drop_test_glider(test_vehicle, height=DROP_TEST_HEIGHT)
-
-    model = mujoco.MjModel.from_xml_string(test_xml)
+    model = build_model(test_vehicle)
     data = mujoco.MjData(model)
-    mujoco.mj_resetData(model, data)
-
     frames: list[TrajectoryFrameDict] = []
 
-    while len(data.contact) < 1:
-        mujoco.mj_step(model, data)
+    for _ in step_to_landing(model, data):
         while len(frames) < data.time * sample_rate:
             frames.append({
                 "time": float(data.time),
@@ -124,8 +158,7 @@ def simulate_trajectory(
                 "orientation": data.body("body").xquat.tolist(),
             })
 
-    distance = abs(data.geom("vehicle-wing").xpos[0])
-    fitness = _compute_fitness(distance, test_vehicle.vertices)
+    fitness = compute_fitness(landing_distance(data), test_vehicle.vertices)
     return frames, fitness
 
 
@@ -134,8 +167,14 @@ def _create_random_vehicle(
     max_dim_m: float,
     pilot: bool,
     mass_kg: float | None,
+    vertices: list[list[float]] | np.ndarray | None = None,
 ) -> Vehicle:
-    """Create a random Vehicle using the appropriate shape config."""
+    """
+    Create a random Vehicle using the appropriate shape config.
+
+    Point-cloud vehicles use 'vertices' when given, so callers can draw a
+    whole generation's genomes in one call.
+    """
     cfg: ShapeConfig
     if shape_type == "naca":
         cfg = NacaConfig.random(max_dim_m=max_dim_m)
@@ -155,6 +194,7 @@ def _create_random_vehicle(
         )
     else:
         return Vehicle(
+            vertices=vertices,
             num_vertices=NUM_GENES,
             max_dim_m=max_dim_m,
             pilot=pilot,
@@ -162,6 +202,23 @@ def _create_random_vehicle(
         )
 
 
+def _mutate_point_clouds(targets: list[Vehicle]) -> list[np.ndarray]:
+    """Mutate point-cloud vehicles, one Vehicle.mutate_batch call per genome size."""
+    mutated: dict[int, np.ndarray] = {}
+
+    by_size: dict[int, list[int]] = {}
+    for i, target in enumerate(targets):
+        by_size.setdefault(len(target.vertices), []).append(i)
+
+    for indices in by_size.values():
+        parents = np.stack([targets[i].vertices for i in indices])
+        max_dims = np.array([targets[i].max_dim_m for i in indices])
+        for i, child in zip(indices, Vehicle.mutate_batch(parents, max_dims)):
+            mutated[i] = child
+
+    return [mutated[i] for i in range(len(targets))]
+
+
 def iterate_population(
     input_population: list[Vehicle],
     survival_weight: float = 0.3,
@@ -195,10 +252,16 @@ def iterate_population(
     survivor_results = ranking[: int(population_size * survival_weight)]
     survivors: list[Vehicle] = [result[0] for result in survivor_results]
 
-    clones: list[Vehicle] = []
-    for i in range(int(population_size * cloning_weight)):
-        target = survivors[i % len(survivors)]
+    targets = [
+        survivors[i % len(survivors)]
+        for i in range(int(population_size * cloning_weight))
+    ]
+    mutated_point_clouds = iter(
+        _mutate_point_clouds([t for t in targets if t.shape_config is None])
+    )
 
+    clones: list[Vehicle] = []
+    for target in targets:
         if target.shape_config is not None:
             new_shape_config = target.shape_config.mutate()
             clones.append(
@@ -212,36 +275,72 @@ def iterate_population(
         else:
             clones.append(
                 Vehicle(
-                    vertices=target.mutate(),
+                    vertices=next(mutated_point_clouds),
                     max_dim_m=target.max_dim_m,
                     pilot=pilot,
                     mass_kg=mass_kg,
                 )
             )
 
-    random_population = [
-        _create_random_vehicle(shape_type, max_dim_m, pilot, mass_kg)
-        for _ in range(population_size - len(clones) - len(survivors))
-    ]
+    num_random = population_size - len(clones) - len(survivors)
+    if shape_type in ("naca", "parametric"):
+        random_population = [
+            _create_random_vehicle(shape_type, max_dim_m, pilot, mass_kg)
+            for _ in range(num_random)
+        ]
+    else:
+        all_vertices = create_points(num_random * NUM_GENES, max_dim_m).reshape(
+            num_random, NUM_GENES, 3
+        )
+        random_population = [
+            _create_random_vehicle(
+                shape_type, max_dim_m, pilot, mass_kg, vertices=vertices
+            )
+            for vertices in all_vertices
+        ]
 
     new_population = survivors + clones + random_population
 
     return ranking, new_population
 
 
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # forkserver: the pool may first be created from a server thread,
+            # and forking a multi-threaded process can deadlock the child.
+            _POOL = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context("forkserver"),
+            )
+        return _POOL
+
+
 def evaluate_population(
         input_population: list[Vehicle],
         fitness_func: Callable[[Vehicle], float] = fitness_func,
         ) -> list[tuple[Vehicle, float]]:
+    """
+    Score every vehicle in parallel across a process pool and return the
+    population ranked by fitness, best first.
+
+    fitness_func must be picklable (a module-level function), since it is
+    shipped to the worker processes along with each Vehicle.
+    """
 
-    results: list[float] = []
-    for v in input_population:
-        results.append(fitness_func(v))
+    workers = os.cpu_count() or 1
+    chunksize = max(1, len(input_population) // (4 * workers))
+    results: list[float] = list(
+        _get_pool().map(fitness_func, input_population, chunksize=chunksize)
+    )
 
     assert len(input_population) == len(results)
 
-    # Ranking is a combination of glider and fitness
-    ranking = list(zip(input_population, results))
-    ranking.sort(key=lambda x: x[1], reverse=True)
+    # Ranking is a combination of glider and fitness, best first.
+    # A stable sort of the negated scores keeps ties in population order.
+    scores = np.fromiter(results, dtype=np.float64, count=len(results))
+    order = np.argsort(-scores, kind="stable")
+    ranking = [(input_population[i], float(scores[i])) for i in order]
 
     return ranking
@@ -4,7 +4,7 @@ from collections.abc import Callable, Iterable
 from typing import Any
 
 from .optimization import fitness_func
-from .surface import spherical_delaunay_surface
+from .surface import cached_spherical_delaunay_surface
 from .vehicle import Vehicle
 
 SurfaceBuilder = Callable[
@@ -15,7 +15,7 @@ FitnessFunc = Callable[[Vehicle], float]
 
 def process_genome(
     vertices: Iterable[Iterable[float]],
-    surface_builder: SurfaceBuilder = spherical_delaunay_surface,
+    surface_builder: SurfaceBuilder = cached_spherical_delaunay_surface,
     fitness: FitnessFunc = fitness_func,
     **vehicle_kwargs: Any,
 ) -> tuple[Vehicle, float]:
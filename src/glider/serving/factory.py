@@ -98,7 +98,7 @@ def vehicle_from_schema(v: VehicleType) -> Vehicle:
             pc_max = v.max_dim_m
 
         cfg = PointCloudConfig(
-            vertices=vertices or [],
+            vertices=vertices if vertices is not None else [],
             max_dim_m=(
                 pc_max
                 if pc_max is not None
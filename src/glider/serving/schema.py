@@ -1,8 +1,21 @@
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Annotated, Any
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from glider.vehicle import Vehicle
+
+
+# An [x, y, z] vertex. The constraints are enforced by pydantic-core, so
+# malformed geometry is a 422 at no cost over a plain list[list[float]].
+Vertex = Annotated[
+    list[Annotated[float, Field(allow_inf_nan=False)]],
+    Field(min_length=3, max_length=3),
+]
 
 
 class VehicleType(BaseModel):
-    vertices: list[list[float]] | None
+    vertices: list[Vertex] | None
     faces: list[list[int]] | None
     max_dim_m: float | None
     mass_kg: float | None
@@ -14,6 +27,23 @@ class VehicleType(BaseModel):
     parametric_params: dict | None = None
     shape_params: dict | None = None
 
+    @classmethod
+    def from_vehicle(cls, vehicle: "Vehicle", **fields: Any) -> "VehicleType":
+        """Wrap a server-built Vehicle without re-validating its geometry.
+
+        Extra keyword arguments set the shape fields.
+        """
+        return cls.model_construct(
+            vertices=vehicle.vertices.tolist(),
+            faces=vehicle.faces,
+            max_dim_m=vehicle.max_dim_m,
+            mass_kg=vehicle.mass_kg,
+            orientation=vehicle.orientation,
+            wing_density=vehicle.wing_density,
+            pilot=vehicle.pilot,
+            **fields,
+        )
+
 
 class EvolutionRequest(BaseModel):
     population_size: int = 100
@@ -53,5 +83,5 @@ class DropTestTrajectoryResult(BaseModel):
     fitness: float
     sample_rate: int
     frames: list[TrajectoryFrame]
-    vertices: list[list[float]]
+    vertices: list[Vertex]
     faces: list[list[int]]
@@ -1,13 +1,20 @@
+import asyncio
+import functools
+import os
 from base64 import b64encode
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from io import BytesIO
+from typing import Any, TypeVar
 
+import orjson
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from PIL import Image
 
-from glider import optimization, vehicle, visualization
+from glider import optimization, simulation, vehicle, visualization
 from glider.constants import WING_DENSITY
 from glider.shapes import (
     NacaConfig,
@@ -20,12 +27,24 @@ from .schema import (
     DropTestTrajectoryResult,
     DropTestVideoResult,
     EvolutionRequest,
-    GenerationResult,
     TrajectoryFrame,
     VehicleType,
 )
 
-app = FastAPI()
+T = TypeVar("T")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Simulation and rendering handlers run on the loop's default executor;
+    # size it to the machine rather than asyncio's default.
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=os.cpu_count())
+    )
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -41,6 +60,12 @@ app.add_middleware(
 )
 
 
+async def _run_blocking(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run synchronous MuJoCo work off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+
 @app.get("/")
 def read_root() -> dict[str, str]:
     return {"Hello": "World"}
@@ -48,30 +73,15 @@ def read_root() -> dict[str, str]:
 
 @app.get("/vehicle/")
 async def create_vehicle() -> VehicleType:
-    v = vehicle.Vehicle()
-    return VehicleType(
-        vertices=v.vertices,
-        faces=v.faces,
-        max_dim_m=v.max_dim_m,
-        mass_kg=v.mass_kg,
-        orientation=v.orientation,
-        wing_density=v.wing_density,
-        pilot=v.pilot,
-    )
+    return VehicleType.from_vehicle(vehicle.Vehicle())
 
 
 @app.post("/vehicle/generate/")
 async def generate_vehicle(v: VehicleType) -> VehicleType:
     """Generate a vehicle from shape type and parameters, returning vertices/faces."""
     generated = vehicle_from_schema(v)
-    return VehicleType(
-        vertices=generated.vertices,
-        faces=generated.faces,
-        max_dim_m=generated.max_dim_m,
-        mass_kg=generated.mass_kg,
-        orientation=generated.orientation,
-        wing_density=generated.wing_density,
-        pilot=generated.pilot,
+    return VehicleType.from_vehicle(
+        generated,
         shape_type=v.shape_type,
         naca_params=v.naca_params,
         parametric_params=v.parametric_params,
@@ -81,52 +91,50 @@ async def generate_vehicle(v: VehicleType) -> VehicleType:
 @app.post("/vehicle/drop_test/")
 async def drop_test_vehicle(v: VehicleType) -> str:
     test_vehicle = vehicle_from_schema(v)
-    return optimization.drop_test_glider(test_vehicle)
+    return await _run_blocking(optimization.drop_test_glider, test_vehicle)
 
 
-@app.post("/vehicle/view/")
-async def view_vehicle(v: VehicleType) -> dict[str, str]:
-    test_vehicle = vehicle_from_schema(v)
+def _render_preview(test_vehicle: vehicle.Vehicle) -> str:
     buf = BytesIO()
+    # Lossy WebP at method=0 encodes much faster than PNG's DEFLATE and
+    # gives a far smaller payload for a preview thumbnail.
     Image.fromarray(
         visualization.view_vehicle(test_vehicle)
-    ).save(buf, format="PNG")
+    ).save(buf, format="WEBP", quality=85, method=0)
     b64_image = b64encode(buf.getvalue())
-    return {"data": b64_image.decode("utf-8")}
+    return b64_image.decode("utf-8")
+
+
+@app.post("/vehicle/view/")
+async def view_vehicle(v: VehicleType) -> dict[str, str]:
+    test_vehicle = vehicle_from_schema(v)
+    return {
+        "data": await _run_blocking(_render_preview, test_vehicle),
+        "mime_type": "image/webp",
+    }
 
 
 @app.post("/vehicle/fitness/")
 async def vehicle_fitness(v: VehicleType) -> float:
     test_vehicle = vehicle_from_schema(v)
-    return optimization.fitness_func(test_vehicle)
+    return await _run_blocking(optimization.fitness_func, test_vehicle)
 
 
-@app.post("/vehicle/drop_test_video/")
-async def drop_test_video(
-    v: VehicleType,
-) -> DropTestVideoResult:
-    """Run a drop test and return videos from both camera angles."""
+def _record_drop_test(test_vehicle: vehicle.Vehicle) -> DropTestVideoResult:
     import mujoco
 
-    test_vehicle = vehicle_from_schema(v)
-
-    world_xml = optimization.drop_test_glider(
-        test_vehicle, height=optimization.DROP_TEST_HEIGHT
-    )
-
-    model = mujoco.MjModel.from_xml_string(world_xml)
+    model = optimization.build_model(test_vehicle)
     data = mujoco.MjData(model)
 
-    fixed_frames = visualization.render_to_collision(
-        model, data, framerate=60, camera_name="fixed", show=False
-    )
-
-    mujoco.mj_resetData(model, data)
-    track_frames = visualization.render_to_collision(
-        model, data, framerate=60, camera_name="track", show=False
+    # One simulation renders both cameras; data is left at the landing state.
+    frames = visualization.render_cameras_to_collision(
+        model, data, ["fixed", "track"], framerate=60
     )
+    fixed_frames = frames["fixed"]
+    track_frames = frames["track"]
 
-    fitness = optimization.fitness_func(test_vehicle)
+    distance = simulation.landing_distance(data)
+    fitness = optimization.compute_fitness(distance, test_vehicle.vertices)
 
     fixed_video = visualization.encode_video_to_base64(
         fixed_frames, framerate=60
@@ -142,6 +150,15 @@ async def drop_test_video(
     )
 
 
+@app.post("/vehicle/drop_test_video/")
+async def drop_test_video(
+    v: VehicleType,
+) -> DropTestVideoResult:
+    """Run a drop test and return videos from both camera angles."""
+    test_vehicle = vehicle_from_schema(v)
+    return await _run_blocking(_record_drop_test, test_vehicle)
+
+
 @app.post("/vehicle/drop_test_trajectory/")
 async def drop_test_trajectory(
     v: VehicleType,
@@ -150,15 +167,15 @@ async def drop_test_trajectory(
     """Run a drop test and return per-frame trajectory data plus fitness."""
     test_vehicle = vehicle_from_schema(v)
 
-    raw_frames, fitness = optimization.simulate_trajectory(
-        test_vehicle, sample_rate=sample_rate
+    raw_frames, fitness = await _run_blocking(
+        optimization.simulate_trajectory, test_vehicle, sample_rate=sample_rate
     )
 
     return DropTestTrajectoryResult(
         fitness=fitness,
         sample_rate=sample_rate,
         frames=[TrajectoryFrame(**f) for f in raw_frames],
-        vertices=test_vehicle.vertices,
+        vertices=test_vehicle.vertices.tolist(),
         faces=test_vehicle.faces,
     )
 
@@ -204,7 +221,14 @@ def _make_initial_vehicle(
 
 @app.post("/evolution/run")
 async def run_evolution(req: EvolutionRequest) -> StreamingResponse:
-    def generate() -> Generator[str, None, None]:
+    """
+    Stream one server-sent event per generation.
+
+    Each event's data is JSON shaped like schema.GenerationResult. It is
+    built as a plain dict and encoded with orjson rather than validated
+    through the pydantic model.
+    """
+    async def generate() -> AsyncGenerator[str, None]:
         # Create initial population using shape-aware factory
         population = [
             _make_initial_vehicle(req)
@@ -213,7 +237,8 @@ async def run_evolution(req: EvolutionRequest) -> StreamingResponse:
 
         for gen in range(req.num_generations):
             # Run one generation
-            ranking, population = optimization.iterate_population(
+            ranking, population = await _run_blocking(
+                optimization.iterate_population,
                 population,
                 survival_weight=req.survival_weight,
                 cloning_weight=req.cloning_weight,
@@ -230,17 +255,18 @@ async def run_evolution(req: EvolutionRequest) -> StreamingResponse:
                 sum(all_fitnesses) / len(all_fitnesses)
             )
 
-            # Create result object (uses to_schema() to include shape params)
-            result = GenerationResult(
-                generation=gen,
-                best_fitness=best_fitness,
-                avg_fitness=avg_fitness,
-                best_vehicle=VehicleType(**best_vehicle.to_schema()),
-                population_fitness=all_fitnesses,
-            )
+            # Build the event payload (uses to_schema() to include shape params)
+            payload = {
+                "generation": gen,
+                "best_fitness": best_fitness,
+                "avg_fitness": avg_fitness,
+                "best_vehicle": best_vehicle.to_schema(),
+                "population_fitness": all_fitnesses,
+            }
+            event = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
 
             # Yield SSE-formatted event
-            yield f"data: {result.model_dump_json()}\n\n"
+            yield f"data: {event.decode()}\n\n"
 
     return StreamingResponse(
         generate(), media_type="text/event-stream"
@@ -0,0 +1,49 @@
+import logging
+from collections.abc import Iterator
+
+import mujoco
+
+from .constants import DROP_TEST_MAX_TIME
+
+logger = logging.getLogger(__name__)
+
+
+def diverged(data: mujoco.MjData) -> bool:
+    """Whether MuJoCo has hit a bad QACC and reset the state since mj_resetData."""
+    return bool(data.warning[mujoco.mjtWarning.mjWARN_BADQACC].number)
+
+
+def step_to_landing(
+    model: mujoco.MjModel,
+    data: mujoco.MjData,
+) -> Iterator[mujoco.MjData]:
+    """
+    Reset 'data' and step it until first contact, yielding after each step.
+
+    MuJoCo resets the state when a simulation diverges, so such a vehicle
+    would never land; stepping stops on divergence or once
+    DROP_TEST_MAX_TIME of simulated time has passed. Check landed() after
+    the loop to tell these cases from a landing.
+    """
+    mujoco.mj_resetData(model, data)  # Reset state, time and warnings.
+
+    while data.ncon < 1:
+        mujoco.mj_step(model, data)
+        if diverged(data):
+            logger.warning("Drop test diverged at t=%.2fs", data.time)
+            return
+        if data.time >= DROP_TEST_MAX_TIME:
+            logger.warning("Drop test did not land within %.0fs", data.time)
+            return
+        yield data
+
+
+def landed(data: mujoco.MjData) -> bool:
+    return data.ncon > 0 and not diverged(data)
+
+
+def landing_distance(data: mujoco.MjData) -> float:
+    """Horizontal glide distance at landing; 0.0 if the vehicle never landed."""
+    if not landed(data):
+        return 0.0
+    return float(abs(data.geom("vehicle-wing").xpos[0]))
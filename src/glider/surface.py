@@ -1,10 +1,60 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Iterable
 
 import numpy as np
 import trimesh
 
+# Quantized unit-vector components are packed 21 bits apiece into one
+# uint64 key, offset so the keys sort in the same order as the rows.
+_KEY_BITS = 21
+_KEY_OFFSET = 1 << (_KEY_BITS - 1)
+
+
+def _unique_rows(
+    rounded: np.ndarray, rounding_decimals: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """np.unique(rounded, axis=0, return_index=True) for unit vectors."""
+    scale = 10.0**rounding_decimals
+    if scale >= _KEY_OFFSET:
+        unique_rows, unique_idx = np.unique(rounded, axis=0, return_index=True)
+        return unique_rows, unique_idx
+
+    quantized = (np.rint(rounded * scale) + _KEY_OFFSET).astype(np.uint64)
+    keys = (
+        (quantized[:, 0] << np.uint64(2 * _KEY_BITS))
+        | (quantized[:, 1] << np.uint64(_KEY_BITS))
+        | quantized[:, 2]
+    )
+    _, unique_idx = np.unique(keys, return_index=True)
+    return rounded[unique_idx], unique_idx
+
+
+def _prepare_directions(
+    points: np.ndarray,
+    center: np.ndarray,
+    rounding_decimals: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Return unit directions from center to each point, with zero-length and
+    near-duplicate directions dropped, plus the index of the point each
+    surviving direction came from.
+    """
+    directions = points - center
+    norms = np.sqrt(np.einsum("ij,ij->i", directions, directions))
+    valid = norms > 1e-12
+    original_indices = np.flatnonzero(valid)
+    if original_indices.shape[0] < points.shape[0]:
+        directions = directions[valid]
+        norms = norms[valid]
+    directions /= norms[:, None]
+
+    # Collapse near-duplicate directions to keep hull stable.
+    rounded = np.round(directions, decimals=rounding_decimals)
+    unique_dirs, unique_idx = _unique_rows(rounded, rounding_decimals)
+    return unique_dirs, original_indices[unique_idx]
+
 
 def spherical_delaunay_surface(
     vertices: Iterable[Iterable[float]],
@@ -18,7 +68,10 @@ def spherical_delaunay_surface(
     triangulation. This is a practical stand-in for spherical Delaunay without
     pulling in heavier dependencies.
     """
-    points = np.asarray(list(vertices), dtype=float)
+    points = np.asarray(
+        vertices if isinstance(vertices, np.ndarray) else list(vertices),
+        dtype=float,
+    )
     if points.ndim != 2 or points.shape[0] < 4:
         return points.tolist(), []
 
@@ -27,22 +80,41 @@ def spherical_delaunay_surface(
     else:
         center_vec = np.asarray(center, dtype=float)
 
-    directions = points - center_vec
-    norms = np.linalg.norm(directions, axis=1)
-    valid = norms > 1e-12
-    if np.count_nonzero(valid) < 4:
-        return points.tolist(), []
-
-    directions = directions[valid] / norms[valid][:, None]
-    original_indices = np.nonzero(valid)[0]
-
-    # Collapse near-duplicate directions to keep hull stable.
-    rounded = np.round(directions, decimals=rounding_decimals)
-    unique_dirs, unique_idx = np.unique(rounded, axis=0, return_index=True)
+    unique_dirs, source_indices = _prepare_directions(
+        points, center_vec, rounding_decimals
+    )
     if unique_dirs.shape[0] < 4:
         return points.tolist(), []
 
     hull = trimesh.convex.convex_hull(unique_dirs)
-    faces = original_indices[unique_idx][hull.faces]
+    faces = source_indices[hull.faces]
 
     return points.tolist(), faces.tolist()
+
+
+@functools.lru_cache(maxsize=8192)
+def _spherical_faces(vertex_bytes: bytes) -> tuple[tuple[int, ...], ...]:
+    points = np.frombuffer(vertex_bytes, dtype=float).reshape(-1, 3)
+    _, faces = spherical_delaunay_surface(points)
+    return tuple(tuple(face) for face in faces)
+
+
+def cached_spherical_delaunay_surface(
+    vertices: Iterable[Iterable[float]],
+) -> tuple[list[list[float]], list[list[int]]]:
+    """
+    spherical_delaunay_surface, memoized on the vertices rounded to 6 decimals.
+
+    Survivors and clones carried between generations rebuild the same
+    triangulation; repeat vertex sets become a cache lookup.
+    """
+    points = np.asarray(
+        vertices if isinstance(vertices, np.ndarray) else list(vertices),
+        dtype=float,
+    )
+    if points.ndim != 2 or points.shape[1] != 3:
+        return spherical_delaunay_surface(points)
+
+    key = np.ascontiguousarray(np.round(points, 6)).tobytes()
+    faces = [list(face) for face in _spherical_faces(key)]
+    return points.tolist(), faces
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import string
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import TYPE_CHECKING, Any
 
 import mediapy as media
@@ -22,6 +24,26 @@ from .constants import (
 if TYPE_CHECKING:
     from .shapes import ShapeConfig
 
+# Everything but the per-vehicle orientation, weight and position is fixed
+# at import, so xml() only fills in a template.
+_PILOT_GEOM_XML = create_pilot_geom()
+_WING_GEOM_STYLE = (
+    f'rgba="{WING_RGBA}" type="mesh"'
+    ' mesh="vehicle-wing-mesh"'
+    f' fluidshape="{FLUID_SHAPE}"'
+)
+_BODY_TEMPLATE = string.Template(
+    f"""
+    <body name="body" pos="0 0 0" euler="$euler">
+        <freejoint/>
+        <!-- Main Wing -->
+        <geom name="vehicle-wing" $weight pos="$pos" {_WING_GEOM_STYLE}/>
+        <camera name="track" pos="0 0 0" xyaxes="1 2 0 0 1 2" mode="track"/>
+        $pilot_geom
+    </body>
+    """
+)
+
 
 @dataclass
 class VehicleConfig:
@@ -39,6 +61,7 @@ class Vehicle:
 
     Args:
         vertices (list):        A list of vertices for the main wing.
+                                Stored as an (N, 3) float32 array.
         faces (list):           Lists of indices for the vertices,
                                 which define triangluar faces for the mesh.
                                 Clockwise order is assumed.
@@ -61,7 +84,7 @@ class Vehicle:
 
     def __init__(
         self,
-        vertices: list[list[float]] | None = None,
+        vertices: list[list[float]] | np.ndarray | None = None,
         faces: list[list[int]] | None = None,
         num_vertices: int = 30,
         max_dim_m: float = DEFAULT_MAX_WING_DIMENSION_M,
@@ -80,10 +103,12 @@ class Vehicle:
         self.pilot = pilot
         self.shape_config = shape_config
 
+        self.vertices: np.ndarray
         if shape_config is not None:
-            self.vertices, self.faces = shape_config.generate_mesh()
+            mesh_vertices, self.faces = shape_config.generate_mesh()
+            self.vertices = _as_vertex_array(mesh_vertices)
         elif vertices is not None:
-            self.vertices = vertices
+            self.vertices = _as_vertex_array(vertices)
             self.faces = faces if faces else []
         else:
             self.faces = faces if faces else []
@@ -99,12 +124,7 @@ class Vehicle:
         )
 
     def initialize_vertices(self, num_points: int, max_dim_m: float) -> None:
-        self.vertices = []
-        for _ in range(num_points):
-            vertex = []
-            for _ in range(3):
-                vertex.append(np.random.random() * max_dim_m)
-            self.vertices.append(vertex)
+        self.vertices = _as_vertex_array(np.random.random((num_points, 3)) * max_dim_m)
 
     def mutate(self) -> list[list[float]]:
         if self.shape_config is not None:
@@ -112,31 +132,57 @@ class Vehicle:
             new_vertices, _ = new_config.generate_mesh()
             return new_vertices
 
-        retries = 10
+        mutated: list[list[float]] = Vehicle.mutate_batch(
+            self.vertices[None], self.max_dim_m
+        )[0].tolist()
+        return mutated
+
+    @staticmethod
+    def mutate_batch(
+        parents: np.ndarray,
+        max_dim_m: float | np.ndarray = DEFAULT_MAX_WING_DIMENSION_M,
+        limit_m: float = DEFAULT_MAX_WING_DIMENSION_M,
+    ) -> np.ndarray:
+        """
+        Mutate a (B, G, 3) stack of point-cloud vertices in one pass.
+
+        Each coordinate moves by +/- max_dim_m * MUTATION_RATIO with
+        probability MUTATION_CHANCE. Children whose vertices end up further
+        apart than limit_m are redrawn, up to 10 times, before falling back
+        to the parent. 'max_dim_m' may be a scalar or one value per parent.
+
+        limit_m defaults to the default wing dimension, which is what
+        mutate() has always checked children against.
+        """
+        parents = np.asarray(parents, dtype=float)
+        max_dims = np.broadcast_to(
+            np.asarray(max_dim_m, dtype=float), parents.shape[:1]
+        )
+        children = parents.copy()
 
+        retries = 10
+        pending = np.arange(parents.shape[0])
         for _ in range(retries):
-            new_vertices = []
-            new_vertex = []
-
-            for vertex in self.vertices:
-                new_vertex: list[float] = list()  # type: ignore
-                for dim in vertex:
-                    if np.random.random() < MUTATION_CHANCE:
-                        dim += (
-                            self.max_dim_m * MUTATION_RATIO * np.random.choice((-1, 1))
-                        )
-                    new_vertex.append(dim)
-                new_vertices.append(new_vertex)
-
-            if not Vehicle(new_vertices).exceeds_max_dim():
-                return new_vertices
-            else:
-                continue
-
-        return self.vertices
+            if pending.size == 0:
+                break
+
+            candidates = parents[pending]
+            mask = np.random.random(candidates.shape) < MUTATION_CHANCE
+            signs = np.random.choice((-1, 1), size=candidates.shape)
+            step = (max_dims[pending] * MUTATION_RATIO)[:, None, None]
+            candidates = candidates + mask * signs * step
+
+            diffs = candidates[:, :, None, :] - candidates[:, None, :, :]
+            spans = np.sqrt(np.einsum("bijk,bijk->bij", diffs, diffs))
+            exceeds = (spans > limit_m).any(axis=(1, 2))
+
+            children[pending[~exceeds]] = candidates[~exceeds]
+            pending = pending[exceeds]
+
+        return children
 
     def clone(self) -> Any:
-        return Vehicle(vertices=self.vertices)
+        return Vehicle(vertices=self.vertices.copy())
 
     def load_stl(
         self,
@@ -175,35 +221,19 @@ class Vehicle:
             )
 
     def xml(self) -> tuple[str, str]:
-        density_tag = f'density="{WING_DENSITY}"'
-        mass_tag = f'mass="{self.mass_kg}"'
-        pos_val = " ".join(
-            [str(-self.max_dim_m // 2) for _ in range(3)]
-        )
-        pos_tag = f'pos="{pos_val}"'
-        euler = " ".join(map(str, self.orientation))
         weight = (
-            density_tag if not self.mass_kg else mass_tag
-        )
-        geom_attrs = (
-            f'name="vehicle-wing" {weight} {pos_tag}'
-            f' rgba="{WING_RGBA}" type="mesh"'
-            f' mesh="vehicle-wing-mesh"'
-            f' fluidshape="{FLUID_SHAPE}"'
-        )
-        pilot_geom = (
-            create_pilot_geom() if self.pilot else ""
+            f'density="{WING_DENSITY}"'
+            if not self.mass_kg
+            else f'mass="{self.mass_kg}"'
         )
+        pos = str(-self.max_dim_m // 2)
 
-        body_xml = f"""
-    <body name="body" pos="0 0 0" euler="{euler}">
-        <freejoint/>
-        <!-- Main Wing -->
-        <geom {geom_attrs}/>
-        <camera name="track" pos="0 0 0" xyaxes="1 2 0 0 1 2" mode="track"/>
-        {pilot_geom}
-    </body>
-    """
+        body_xml = _BODY_TEMPLATE.substitute(
+            euler=" ".join(map(str, self.orientation)),
+            weight=weight,
+            pos=f"{pos} {pos} {pos}",
+            pilot_geom=_PILOT_GEOM_XML if self.pilot else "",
+        )
 
         asset_xml = self.get_wing_asset()
         return body_xml, asset_xml
@@ -247,21 +277,25 @@ class Vehicle:
         media.show_image(visualization.view_vehicle(self))
 
     def exceeds_max_dim(self) -> bool:
-        try:
-            for vertex in self.vertices:
-                for second_vertex in self.vertices:
-                    norm = np.linalg.norm(np.array(vertex) - np.array(second_vertex))
-                    assert norm <= self.max_dim_m
-            return False
-        except AssertionError:
-            return True
+        points = self.vertices.astype(float)
+        diffs = points[:, None, :] - points[None, :, :]
+        spans = np.sqrt(np.einsum("ijk,ijk->ij", diffs, diffs))
+        return bool((spans > self.max_dim_m).any())
+
+
+def _as_vertex_array(vertices: list[list[float]] | np.ndarray) -> np.ndarray:
+    # float32 keeps sub-micrometre precision on metre-scale wings and halves
+    # what every vehicle carries through serving and storage.
+    return np.ascontiguousarray(vertices, dtype=np.float32).reshape(-1, 3)
 
 
 def to_vertex_list(
-    points: list[list[float]] | list[list[int]],
+    points: list[list[float]] | list[list[int]] | np.ndarray,
 ) -> str:
-    str_points = []
+    if isinstance(points, np.ndarray):
+        if points.dtype == np.float32:
+            # Python floats would print float32 values with float64 digits.
+            return " ".join(points.ravel().astype(str).tolist())
+        points = points.tolist()
 
-    for point in points:
-        str_points.append(" ".join([str(coord) for coord in list(point)]))
-    return " ".join(str_points)
+    return " ".join(map(str, chain.from_iterable(points)))
@@ -1,3 +1,5 @@
+import atexit
+import threading
 from io import BytesIO
 from typing import Any
 
@@ -8,7 +10,142 @@ import numpy as np
 import pandas as pd
 from PIL import Image
 
-from .constants import AIR_DENSITY, AIR_VISCOSITY
+from .constants import AIR_DENSITY, AIR_VISCOSITY, FRAME_HEIGHT, FRAME_WIDTH
+from .simulation import step_to_landing
+
+# GL contexts are current to one thread, so each thread keeps its own pool.
+_RENDERER_POOL = threading.local()
+
+
+class _PooledRenderer:
+    """
+    Offscreen renderer that keeps its GL context across models.
+
+    mujoco.Renderer is bound to one model for its lifetime, so every request
+    paid for a new GL context. Here only the model-dependent scene and
+    MjrContext are rebuilt when a different model is bound.
+    Mirrors the update_scene/render interface of mujoco.Renderer.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+        self._gl_context: mujoco.GLContext | None = mujoco.GLContext(width, height)
+        self._rect = mujoco.MjrRect(0, 0, width, height)
+        self._scene_option = mujoco.MjvOption()
+        self._model: mujoco.MjModel | None = None
+        self._scene: mujoco.MjvScene | None = None
+        self._mjr_context: mujoco.MjrContext | None = None
+
+    def bind(self, model: mujoco.MjModel) -> None:
+        assert self._gl_context is not None, "renderer is closed"
+        self._gl_context.make_current()
+        if model is self._model:
+            return
+
+        if self._mjr_context is not None:
+            self._mjr_context.free()
+        self._scene = mujoco.MjvScene(model, maxgeom=10000)
+        self._mjr_context = mujoco.MjrContext(
+            model, mujoco.mjtFontScale.mjFONTSCALE_150.value
+        )
+        mujoco.mjr_setBuffer(
+            mujoco.mjtFramebuffer.mjFB_OFFSCREEN.value, self._mjr_context
+        )
+        self._model = model
+
+    def update_scene(self, data: mujoco.MjData, camera: int | str = -1) -> None:
+        assert self._model is not None and self._scene is not None
+
+        camera_id = camera
+        if isinstance(camera_id, str):
+            camera_id = mujoco.mj_name2id(
+                self._model, mujoco.mjtObj.mjOBJ_CAMERA.value, camera_id
+            )
+            if camera_id == -1:
+                raise ValueError(f'The camera "{camera}" does not exist.')
+
+        mjv_camera = mujoco.MjvCamera()
+        mjv_camera.fixedcamid = camera_id
+        if camera_id == -1:
+            mjv_camera.type = mujoco.mjtCamera.mjCAMERA_FREE
+            mujoco.mjv_defaultFreeCamera(self._model, mjv_camera)
+        else:
+            mjv_camera.type = mujoco.mjtCamera.mjCAMERA_FIXED
+
+        mujoco.mjv_updateScene(
+            self._model,
+            data,
+            self._scene_option,
+            None,
+            mjv_camera,
+            mujoco.mjtCatBit.mjCAT_ALL.value,
+            self._scene,
+        )
+
+    def render(self) -> np.ndarray:
+        assert self._scene is not None and self._mjr_context is not None
+        assert self._gl_context is not None
+
+        self._gl_context.make_current()
+        mujoco.mjr_render(self._rect, self._scene, self._mjr_context)
+        pixels = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        mujoco.mjr_readPixels(pixels, None, self._rect, self._mjr_context)
+        # Offscreen buffers are read bottom-up.
+        return np.ascontiguousarray(np.flipud(pixels))
+
+    def close(self) -> None:
+        """Free the GL resources. Must run on the thread that created them."""
+        if self._gl_context is None:
+            return
+        if self._mjr_context is not None:
+            self._gl_context.make_current()
+            self._mjr_context.free()
+            self._mjr_context = None
+        self._gl_context.free()
+        self._gl_context = None
+        self._scene = None
+        self._model = None
+
+
+class _RendererPool(dict[tuple[int, int], _PooledRenderer]):
+    """
+    One thread's renderers, keyed by frame size.
+
+    Held in thread-local storage, so it is dropped on the owning thread when
+    that thread exits, which is the only thread allowed to free the contexts.
+    """
+
+    def close(self) -> None:
+        for renderer in self.values():
+            renderer.close()
+        self.clear()
+
+    def __del__(self) -> None:
+        self.close()
+
+
+def _get_renderer(
+    model: mujoco.MjModel,
+    width: int = FRAME_WIDTH,
+    height: int = FRAME_HEIGHT,
+) -> _PooledRenderer:
+    """Return this thread's renderer for the given size, bound to 'model'."""
+    pool: _RendererPool | None = getattr(_RENDERER_POOL, "renderers", None)
+    if pool is None:
+        pool = _RENDERER_POOL.renderers = _RendererPool()
+
+    renderer = pool.get((width, height))
+    if renderer is None:
+        renderer = pool[(width, height)] = _PooledRenderer(width, height)
+        if threading.current_thread() is threading.main_thread():
+            # The main thread's locals outlive atexit, where mujoco tears down
+            # the GL display; registered after the context exists, this runs
+            # before that teardown.
+            atexit.register(renderer.close)
+
+    renderer.bind(model)
+    return renderer
 
 
 def wrap_glider(glider_xml: str, glider_asset: str, wind: str = "0 0 0") -> str:
@@ -36,7 +173,7 @@ def render_initial_pixels(
     model: mujoco.MjModel,
     data: mujoco.MjData,
 ) -> np.ndarray:
-    renderer = mujoco.Renderer(model)
+    renderer = _get_renderer(model)
 
     mujoco.mj_step(model, data)
 
@@ -80,6 +217,31 @@ def graph_population(ranking: list[tuple[Any, float]]) -> np.ndarray:
     return np.asarray(im)[:, :, :3]
 
 
+def render_cameras_to_collision(
+    model: mujoco.MjModel,
+    data: mujoco.MjData,
+    camera_names: list[str],
+    framerate: int = 60,
+) -> dict[str, list[np.ndarray]]:
+    """
+    Simulate once until first contact, rendering every camera at each frame.
+
+    Returns frames keyed by camera name. 'data' is left at the landing state,
+    so callers can read the contact position without re-simulating.
+    """
+    renderer = _get_renderer(model)
+    frames: dict[str, list[np.ndarray]] = {name: [] for name in camera_names}
+    num_frames = 0
+    for _ in step_to_landing(model, data):  # Render until landing
+        if num_frames < data.time * framerate:
+            for name in camera_names:
+                renderer.update_scene(data, name)
+                frames[name].append(renderer.render())
+            num_frames += 1
+
+    return frames
+
+
 def render_to_collision(
     model: mujoco.MjModel,
     data: mujoco.MjData,
@@ -87,15 +249,9 @@ def render_to_collision(
     camera_name: str = "fixed",
     show: bool = True,
 ) -> list[np.ndarray]:
-    renderer = mujoco.Renderer(model)
-    frames: list[np.ndarray] = []
-    mujoco.mj_resetData(model, data)  # Reset state and time.
-    while len(data.contact) < 1:  # Render until landing
-        mujoco.mj_step(model, data)
-        if len(frames) < data.time * framerate:
-            renderer.update_scene(data, camera_name)
-            pixels = renderer.render()
-            frames.append(pixels)
+    frames = render_cameras_to_collision(
+        model, data, [camera_name], framerate=framerate
+    )[camera_name]
     if show:
         media.show_video(frames, fps=framerate)
 
@@ -110,12 +266,10 @@ def render_xml_to_collision(
 ) -> list[np.ndarray] | None:
     model = mujoco.MjModel.from_xml_string(world_xml)
     data = mujoco.MjData(model)
-    renderer = mujoco.Renderer(model)
-    mujoco.mj_resetData(model, data)  # Reset state and time.
+    renderer = _get_renderer(model)
 
     frames: list[np.ndarray] = []
-    while len(data.contact) < 1:  # Render until landing
-        mujoco.mj_step(model, data)
+    for _ in step_to_landing(model, data):  # Render until landing
         if len(frames) < data.time * framerate:
             renderer.update_scene(data, camera_name)
             pixels = renderer.render()
@@ -134,7 +288,7 @@ def render_for_time_secs(
     framerate: int = 60,
     show: bool = True,
 ) -> list[np.ndarray]:
-    renderer = mujoco.Renderer(model)
+    renderer = _get_renderer(model)
     frames: list[np.ndarray] = []
 
     mujoco.mj_step(model, data)
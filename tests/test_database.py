@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import numpy as np
+import pytest
+from bson.binary import USER_DEFINED_SUBTYPE
+
+from glider import database
+from glider.database import decode_vertices, write
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = []
+
+    def insert_one(self, document):
+        self.documents.append(document)
+
+
+def test_write_packs_vertices():
+    collection = FakeCollection()
+    db = {"data-v2": collection}
+    vertices = np.random.random((5, 3)).astype(np.float32)
+
+    write(db, {"vehicles": [{"vertices": vertices, "fitness": 1.5}]})
+
+    stored = collection.documents[0]["vehicles"][0]
+    assert stored["fitness"] == 1.5
+    assert stored["vertices"].subtype == USER_DEFINED_SUBTYPE
+    assert len(stored["vertices"]) == vertices.nbytes
+    assert np.array_equal(decode_vertices(stored["vertices"]), vertices)
+
+
+def test_write_rejects_other_arrays():
+    collection = FakeCollection()
+    db = {"data-v2": collection}
+
+    with pytest.raises(TypeError):
+        write(db, {"faces": np.array([[0, 1, 2]])})
+    with pytest.raises(TypeError):
+        write(db, {"vertices": np.array([[0, 1, 2]])})
+
+    assert collection.documents == []
+
+
+def test_get_client_creates_one_client(monkeypatch):
+    created = []
+    monkeypatch.setattr(database, "_CLIENT", None)
+    monkeypatch.setattr(database.atexit, "register", lambda func: None)
+    monkeypatch.setattr(
+        database.pymongo,
+        "MongoClient",
+        lambda *args: created.append(args) or mock.Mock(),
+    )
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: database._get_client(), range(32)))
+
+    assert len(created) == 1
+    assert all(client is clients[0] for client in clients)
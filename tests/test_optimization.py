@@ -1,19 +1,31 @@
+import mujoco
+import numpy as np
+import pytest
+
 from glider.optimization import (
-    create_point,
+    build_model,
+    create_points,
+    evaluate_population,
     fitness_func,
     iterate_population,
+    rollout,
 )
+from glider.shapes import NacaConfig, ParametricConfig
+from glider.simulation import landed
 from glider.vehicle import Vehicle
 
 
-def test_create_point():
+def test_create_points():
     max_dim = 5.0
-    point = create_point(max_dim_m=max_dim)
-    for dim in point:
-        assert dim <= max_dim
+    points = create_points(4, max_dim_m=max_dim)
+    assert points.shape == (4, 3)
+
+    for point in points:
+        for dim in point:
+            assert dim <= max_dim
 
-    assert point[0] != point[1]
-    assert point[1] != point[2]
+        assert point[0] != point[1]
+        assert point[1] != point[2]
 
 
 def test_iterate_population():
@@ -42,3 +54,38 @@ def test_iterate_population():
         )
 
         assert fitnesses_2[0] >= fitnesses[0]
+
+
+def test_evaluate_population_matches_serial():
+    population = [Vehicle(num_vertices=10, max_dim_m=1.5) for _ in range(6)]
+
+    ranking = evaluate_population(population)
+
+    assert sorted(score for _, score in ranking) == sorted(
+        fitness_func(v) for v in population
+    )
+    scores = [score for _, score in ranking]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_build_model_reuses_compiled_model():
+    test_vehicle = Vehicle(num_vertices=10, max_dim_m=1.5)
+
+    assert build_model(test_vehicle) is build_model(test_vehicle)
+    assert fitness_func(test_vehicle) == fitness_func(test_vehicle)
+
+
+@pytest.mark.parametrize(
+    "make_config",
+    [lambda: NacaConfig.random(max_dim_m=4.5), ParametricConfig.random],
+    ids=["naca", "parametric"],
+)
+def test_mesh_vehicles_land(make_config):
+    np.random.seed(1)
+    for _ in range(10):
+        vehicle = Vehicle(shape_config=make_config())
+        model = build_model(vehicle)
+        data = mujoco.MjData(model)
+
+        assert rollout(model, data) >= 0.0
+        assert landed(data)
@@ -0,0 +1,108 @@
+from base64 import b64decode
+from io import BytesIO
+
+import pytest
+from fastapi.testclient import TestClient
+from PIL import Image
+from pydantic import ValidationError
+
+from glider.serving.schema import VehicleType
+from glider.serving.server import app
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+def test_create_vehicle(client):
+    response = client.get("/vehicle/")
+    assert response.status_code == 200
+
+    result = VehicleType(**response.json())
+    assert len(result.vertices) == 30
+    assert result.shape_type == "point_cloud"
+
+
+def test_generate_vehicle_naca(client):
+    request_data = {
+        "vertices": None,
+        "faces": None,
+        "max_dim_m": 4.5,
+        "mass_kg": None,
+        "orientation": None,
+        "wing_density": None,
+        "shape_type": "naca",
+        "naca_params": {"digits": "2412", "span": 2.0, "chord": 0.5},
+    }
+
+    response = client.post("/vehicle/generate/", json=request_data)
+    assert response.status_code == 200
+
+    result = VehicleType(**response.json())
+    assert result.shape_type == "naca"
+    assert result.naca_params == request_data["naca_params"]
+    assert len(result.vertices) > 0
+    assert len(result.faces) > 0
+    assert all(len(vertex) == 3 for vertex in result.vertices)
+
+
+def test_vehicle_type_validates_vertices():
+    v = VehicleType(
+        vertices=[[0.1, 0.2, 0.3], [1.0, 2.0, 3.0]],
+        faces=None,
+        max_dim_m=None,
+        mass_kg=None,
+        orientation=None,
+        wing_density=None,
+    )
+
+    assert v.model_dump(mode="json")["vertices"] == [
+        [0.1, 0.2, 0.3],
+        [1.0, 2.0, 3.0],
+    ]
+
+    for bad_vertices in (
+        [[0.1, 0.2]],
+        {"a": 1},
+        [1, 2, 3, 4, 5, 6],
+        [[[1, 2, 3]]],
+        [[None, 1, 2]],
+        [[1, 2], [1, 2, 3]],
+    ):
+        with pytest.raises(ValidationError):
+            VehicleType(
+                vertices=bad_vertices,
+                faces=None,
+                max_dim_m=None,
+                mass_kg=None,
+                orientation=None,
+                wing_density=None,
+            )
+
+
+def test_view_vehicle_returns_webp(client):
+    vehicle_json = client.get("/vehicle/").json()
+
+    response = client.post("/vehicle/view/", json=vehicle_json)
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["mime_type"] == "image/webp"
+    image = Image.open(BytesIO(b64decode(result["data"])))
+    assert image.format == "WEBP"
+
+
+def test_generate_vehicle_rejects_bad_vertices(client):
+    response = client.post(
+        "/vehicle/generate/",
+        json={
+            "vertices": {"a": 1},
+            "faces": None,
+            "max_dim_m": None,
+            "mass_kg": None,
+            "orientation": None,
+            "wing_density": None,
+        },
+    )
+    assert response.status_code == 422
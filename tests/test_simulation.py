@@ -0,0 +1,29 @@
+import mujoco
+
+from glider.constants import DROP_TEST_MAX_TIME
+from glider.simulation import landed, landing_distance, step_to_landing
+
+FLOATING_WORLD = """
+<mujoco>
+    <option gravity="0 0 0" timestep="1"/>
+    <worldbody>
+        <body name="body">
+            <freejoint/>
+            <geom name="vehicle-wing" type="sphere" size="1"/>
+        </body>
+        <geom name="platform-geom" type="plane" size="10 10 1" pos="0 0 -10"/>
+    </worldbody>
+</mujoco>
+"""
+
+
+def test_step_to_landing_stops_at_time_limit():
+    model = mujoco.MjModel.from_xml_string(FLOATING_WORLD)
+    data = mujoco.MjData(model)
+
+    steps = sum(1 for _ in step_to_landing(model, data))
+
+    assert steps < DROP_TEST_MAX_TIME
+    assert data.time >= DROP_TEST_MAX_TIME
+    assert not landed(data)
+    assert landing_distance(data) == 0.0
@@ -0,0 +1,73 @@
+import pytest
+
+from glider import surface
+from glider.surface import (
+    cached_spherical_delaunay_surface,
+    spherical_delaunay_surface,
+)
+
+# trimesh delegates convex hulls to scipy, which is not a hard dependency.
+pytest.importorskip("scipy")
+
+
+def test_spherical_delaunay_surface_cube():
+    cube = [
+        [x, y, z] for x in (0.0, 1.0) for y in (0.0, 1.0) for z in (0.0, 1.0)
+    ]
+
+    vertices, faces = spherical_delaunay_surface(cube)
+
+    assert vertices == cube
+    assert len(faces) == 12
+    assert {i for face in faces for i in face} == set(range(8))
+
+
+def test_spherical_delaunay_surface_collapses_duplicate_directions():
+    points = [
+        [1.0, 0.0, 0.0],
+        [-1.0, 0.0, 0.0],
+        [0.0, 1.0, 0.0],
+        [0.0, -1.0, 0.0],
+        [0.0, 0.0, 1.0],
+        [0.0, 0.0, -1.0],
+        [2.0, 0.0, 0.0],  # same direction as the first point
+    ]
+
+    _, faces = spherical_delaunay_surface(points, center=[0.0, 0.0, 0.0])
+
+    used = {i for face in faces for i in face}
+    assert len(faces) == 8
+    assert len(used & {0, 6}) == 1
+
+
+def test_spherical_delaunay_surface_too_few_points():
+    points = [[0.0, 0.0, 0.0], [1.0, 0.0, 0.0], [0.0, 1.0, 0.0]]
+
+    vertices, faces = spherical_delaunay_surface(points)
+
+    assert vertices == points
+    assert faces == []
+
+
+def test_cached_spherical_delaunay_surface():
+    cube = [
+        [x, y, z] for x in (0.0, 2.0) for y in (0.0, 2.0) for z in (0.0, 2.0)
+    ]
+
+    expected = spherical_delaunay_surface(cube)
+    surface._spherical_faces.cache_clear()
+
+    assert cached_spherical_delaunay_surface(cube) == expected
+    info = surface._spherical_faces.cache_info()
+    assert (info.hits, info.misses) == (0, 1)
+
+    assert cached_spherical_delaunay_surface(cube) == expected
+    info = surface._spherical_faces.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+    # Differences below the 1e-6 rounding share the cached triangulation.
+    near_cube = [[c + 1e-8 for c in point] for point in cube]
+    _, faces = cached_spherical_delaunay_surface(near_cube)
+    assert faces == expected[1]
+    info = surface._spherical_faces.cache_info()
+    assert (info.hits, info.misses) == (2, 1)
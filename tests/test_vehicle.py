@@ -1,6 +1,8 @@
+import numpy as np
 import pytest
 
-from glider.vehicle import Vehicle
+from glider.constants import MUTATION_RATIO
+from glider.vehicle import Vehicle, to_vertex_list
 
 
 @pytest.fixture
@@ -63,7 +65,7 @@ def test_initialize():
     vehicle_3 = Vehicle(num_vertices=10)
     for point in vehicle_3.vertices:
         assert len(point) == 3
-        assert point not in vehicle_2.vertices
+        assert point.tolist() not in vehicle_2.vertices.tolist()
 
 
 def test_specify_mass():
@@ -107,7 +109,7 @@ def test_mutate(cube_vertices):
 
     # All vertices should be different
     for vertex in new_vertices:
-        assert vertex not in vehicle1.vertices
+        assert vertex not in vehicle1.vertices.tolist()
 
     vehicle2 = Vehicle(vertices=new_vertices)
     assert vehicle2
@@ -121,5 +123,40 @@ def test_clone():
     vehicle1 = Vehicle(num_vertices=8)
     vehicle2 = vehicle1.clone()
 
-    assert vehicle1.vertices == vehicle2.vertices
+    assert np.array_equal(vehicle1.vertices, vehicle2.vertices)
+    assert vehicle1.vertices is not vehicle2.vertices
     assert id(vehicle1) != id(vehicle2)
+
+
+def test_mutate_batch(cube_vertices):
+    half_cube = [[a / 2, b / 2, c / 2] for a, b, c in cube_vertices]
+    parents = np.array([cube_vertices, half_cube])
+
+    children = Vehicle.mutate_batch(parents, max_dim_m=2.0, limit_m=2.0)
+
+    assert children.shape == parents.shape
+    assert not np.array_equal(children, parents)
+
+    moved = np.abs(children - parents)
+    step = 2.0 * MUTATION_RATIO
+    assert np.all(np.isclose(moved, 0.0) | np.isclose(moved, step))
+
+    for child in children:
+        assert not Vehicle(vertices=child.tolist(), max_dim_m=2.0).exceeds_max_dim()
+
+
+def test_to_vertex_list():
+    assert to_vertex_list([[1.5, 0.0, 2.0], [0.1, 0.2, 0.3]]) == (
+        "1.5 0.0 2.0 0.1 0.2 0.3"
+    )
+    assert to_vertex_list([[0, 1, 2, 3]]) == "0 1 2 3"
+    assert to_vertex_list(np.array([[0.1, 0.2, 0.3]], dtype=np.float32)) == (
+        "0.1 0.2 0.3"
+    )
+
+
+def test_vertices_are_float32(cube_vertices):
+    vehicle = Vehicle(vertices=cube_vertices)
+    assert vehicle.vertices.dtype == np.float32
+    assert vehicle.vertices.shape == (8, 3)
+    assert vehicle.vertices.tolist() == cube_vertices
@@ -1,3 +1,5 @@
+import threading
+
 import glider.visualization as visualization
 from glider.constants import FRAME_HEIGHT, FRAME_WIDTH
 from glider.vehicle import Vehicle
@@ -8,3 +10,30 @@ def test_view_vehicle():
 
     pixels = visualization.view_vehicle(v)
     assert pixels.shape == (FRAME_HEIGHT, FRAME_WIDTH, 3)
+
+
+def test_view_vehicle_reuses_renderer():
+    first = visualization.view_vehicle(Vehicle(num_vertices=10))
+    pool = visualization._RENDERER_POOL.renderers
+    renderer = pool[(FRAME_WIDTH, FRAME_HEIGHT)]
+
+    second = visualization.view_vehicle(Vehicle(num_vertices=10))
+
+    assert first.shape == second.shape == (FRAME_HEIGHT, FRAME_WIDTH, 3)
+    assert pool[(FRAME_WIDTH, FRAME_HEIGHT)] is renderer
+
+
+def test_renderer_closed_when_thread_exits():
+    renderers = []
+
+    def render_in_thread():
+        visualization.view_vehicle(Vehicle(num_vertices=10))
+        renderers.append(
+            visualization._RENDERER_POOL.renderers[(FRAME_WIDTH, FRAME_HEIGHT)]
+        )
+
+    thread = threading.Thread(target=render_in_thread)
+    thread.start()
+    thread.join()
+
+    assert renderers[0]._gl_context is None